@@ -1,6 +1,7 @@
 from flask import Flask, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from sqlalchemy import case, func, inspect, text, update
 from datetime import datetime
 import os
 
@@ -13,6 +14,8 @@ db_path = os.path.join(os.path.dirname(__file__), 'library.db')
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'indian-library-2024'
+# Wait for SQLite write lock instead of failing straight away under load
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 15}}
 
 # Initialize database
 db = SQLAlchemy(app)
@@ -26,7 +29,8 @@ class Book(db.Model):
     language = db.Column(db.String(50))
     published_year = db.Column(db.Integer)
     genre = db.Column(db.String(50))
-    available = db.Column(db.Boolean, default=True)
+    available = db.Column(db.Boolean, nullable=False, default=True)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     added_by = db.Column(db.String(50))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -39,6 +43,7 @@ class Book(db.Model):
             'published_year': self.published_year,
             'genre': self.genre,
             'available': self.available,
+            'version': self.version,
             'added_by': self.added_by,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S')
         }
@@ -115,6 +120,23 @@ def add_sample_data():
     db.session.commit()
     print(f"✅ Added {len(sample_books)} Indian books (10 by sai, 10 by teja)")
 
+def migrate_database():
+    """Bring older library.db files up to the current schema"""
+    db.create_all()
+    
+    # Older databases were created before the version column existed
+    columns = [column['name'] for column in inspect(db.engine).get_columns('book')]
+    if 'version' not in columns:
+        db.session.execute(text('ALTER TABLE book ADD COLUMN version INTEGER NOT NULL DEFAULT 0'))
+    
+    # A NULL available could never be checked out or returned
+    db.session.execute(text('UPDATE book SET available = 1 WHERE available IS NULL'))
+    db.session.commit()
+
+# Runs on import so flask run / gunicorn get the migrated schema too
+with app.app_context():
+    migrate_database()
+
 # ============= AUTHENTICATION =============
 
 VALID_USERS = {
@@ -165,6 +187,9 @@ def home():
             'GET /api/books',
             'GET /api/books/search?q=query',
             'POST /api/books',
+            'POST /api/books/<id>/checkout',
+            'POST /api/books/<id>/return',
+            'POST /api/books/checkout',
             'GET /api/stats'
         ]
     })
@@ -206,6 +231,9 @@ def add_book():
     if not data.get('title') or not data.get('author'):
         return jsonify({'error': 'Title and author required'}), 400
     
+    if not isinstance(data.get('available', True), bool):
+        return jsonify({'error': 'available must be true or false'}), 400
+    
     book = Book(
         title=data['title'],
         author=data['author'],
@@ -266,11 +294,120 @@ def delete_book(book_id):
         'deleted_by': request.user
     })
 
+# ============= LENDING =============
+
+def change_availability(book_id, available):
+    """Flip a book's availability with one conditional UPDATE"""
+    # The WHERE only matches a book in the opposite state (and at the
+    # client's version, if sent), so two clients can't both check it out
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    
+    version = data.get('version')
+    if version is not None and (not isinstance(version, int) or isinstance(version, bool)):
+        return jsonify({'error': 'version must be an integer'}), 400
+    
+    conditions = [Book.id == book_id, Book.available == (not available)]
+    if version is not None:
+        conditions.append(Book.version == version)
+    
+    # RETURNING gives back exactly the row this UPDATE wrote
+    book = db.session.execute(
+        update(Book)
+        .where(*conditions)
+        .values(available=available, version=Book.version + 1)
+        .returning(Book)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    
+    if book:
+        # Serialize before commit, which would reload it from the database
+        book_data = book.to_dict()
+        db.session.commit()
+        return jsonify({
+            'success': True,
+            'message': 'Book checked out' if not available else 'Book returned',
+            'book': book_data,
+            'user': request.user
+        })
+    
+    db.session.rollback()
+    
+    # Nothing matched - work out why
+    book = Book.query.get(book_id)
+    if not book:
+        return jsonify({'error': 'Book not found'}), 404
+    if book.available == available:
+        error = 'Book is already checked out' if not available else 'Book is not checked out'
+    else:
+        error = 'Book was changed by someone else, reload and try again'
+    return jsonify({'error': error, 'book': book.to_dict()}), 409
+
+@app.route('/api/books/<int:book_id>/checkout', methods=['POST'])
+@require_auth
+def checkout_book(book_id):
+    return change_availability(book_id, False)
+
+@app.route('/api/books/<int:book_id>/return', methods=['POST'])
+@require_auth
+def return_book(book_id):
+    return change_availability(book_id, True)
+
+@app.route('/api/books/checkout', methods=['POST'])
+@require_auth
+def checkout_books():
+    """Check out a whole cart - either every book or none of them"""
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    book_ids = data.get('book_ids')
+    
+    if not book_ids or not isinstance(book_ids, list):
+        return jsonify({'error': 'book_ids list required'}), 400
+    if not all(isinstance(book_id, int) and not isinstance(book_id, bool) for book_id in book_ids):
+        return jsonify({'error': 'book_ids must be integers'}), 400
+    
+    book_ids = sorted(set(book_ids))
+    
+    books = db.session.execute(
+        update(Book)
+        .where(Book.id.in_(book_ids), Book.available == True)
+        .values(available=False, version=Book.version + 1)
+        .returning(Book)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    
+    if len(books) != len(book_ids):
+        db.session.rollback()
+        found = Book.query.filter(Book.id.in_(book_ids)).all()
+        found_ids = {book.id for book in found}
+        return jsonify({
+            'error': 'Some books could not be checked out, nothing was checked out',
+            'not_found': [book_id for book_id in book_ids if book_id not in found_ids],
+            'unavailable': [book.id for book in found if not book.available]
+        }), 409
+    
+    books_data = sorted((book.to_dict() for book in books), key=lambda book: book['id'])
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'message': f'{len(books_data)} books checked out',
+        'count': len(books_data),
+        'books': books_data,
+        'user': request.user
+    })
+
 @app.route('/api/stats', methods=['GET'])
 @require_auth
 def get_stats():
-    total = Book.query.count()
-    available = Book.query.filter_by(available=True).count()
+    # Count both in one query so checkouts can't land in between
+    total, available = db.session.query(
+        func.count(Book.id),
+        func.coalesce(func.sum(case((Book.available == True, 1), else_=0)), 0)
+    ).one()
+    checked_out = total - available
     by_sai = Book.query.filter_by(added_by='sai').count()
     by_teja = Book.query.filter_by(added_by='teja').count()
     
@@ -279,6 +416,7 @@ def get_stats():
         'stats': {
             'total_books': total,
             'available_books': available,
+            'checked_out_books': checked_out,
             'books_by_sai': by_sai,
             'books_by_teja': by_teja,
             'languages': {
@@ -1,5 +1,7 @@
 import requests
 import base64
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:5000"
 
@@ -8,6 +10,16 @@ def get_auth_header(username, password):
     encoded = base64.b64encode(auth.encode()).decode()
     return {"Authorization": f"Basic {encoded}"}
 
+failures = []
+
+def check(name, actual, expected):
+    """Print a lending check and remember it if it failed"""
+    if actual == expected:
+        print(f"   ✅ {name}: {actual}")
+    else:
+        print(f"   ❌ {name}: got {actual}, expected {expected}")
+        failures.append(name)
+
 print("🧪 Testing Indian Library API...")
 print()
 
@@ -62,8 +74,72 @@ try:
 except:
     print("   ❌ Failed")
 
+# Test 5: Checkout and return a book
+print("\n5. Checking out and returning book 1 (as sai)...")
+try:
+    headers = get_auth_header("sai", "sai@123")
+    response = requests.post(f"{BASE_URL}/api/books/1/checkout", headers=headers)
+    check("checkout of an available book", response.status_code, 200)
+    response = requests.post(f"{BASE_URL}/api/books/1/checkout", headers=headers)
+    check("second checkout of the same book", response.status_code, 409)
+    response = requests.post(f"{BASE_URL}/api/books/1/return", headers=headers)
+    check("return of a checked out book", response.status_code, 200)
+except Exception as e:
+    check("checkout and return", f"error {e}", "no error")
+
+# Test 6: Many clients checking out the same book at once
+print("\n6. 20 clients checking out book 2 at the same time...")
+try:
+    headers = get_auth_header("teja", "teja@123")
+    
+    def checkout(_):
+        return requests.post(f"{BASE_URL}/api/books/2/checkout", headers=headers).status_code
+    
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        codes = list(pool.map(checkout, range(20)))
+    check("concurrent checkouts that succeeded", codes.count(200), 1)
+    check("concurrent checkouts refused", codes.count(409), 19)
+    requests.post(f"{BASE_URL}/api/books/2/return", headers=headers)
+except Exception as e:
+    check("concurrent checkout", f"error {e}", "no error")
+
+# Test 7: Batch checkout of a cart
+print("\n7. Checking out a cart of books 3, 4, 5 (as teja)...")
+try:
+    headers = get_auth_header("teja", "teja@123")
+    response = requests.post(f"{BASE_URL}/api/books/checkout", headers=headers,
+                             json={"book_ids": [3, 4, 5]})
+    check("cart checkout", response.status_code, 200)
+    stats = requests.get(f"{BASE_URL}/api/stats", headers=headers).json()['stats']
+    print(f"   📊 Available: {stats['available_books']}, checked out: {stats['checked_out_books']}")
+    for book_id in [3, 4, 5]:
+        requests.post(f"{BASE_URL}/api/books/{book_id}/return", headers=headers)
+except Exception as e:
+    check("cart checkout", f"error {e}", "no error")
+
+# Test 8: Optimistic versioning
+print("\n8. Checking out book 6 with a stale and a current version (as sai)...")
+try:
+    headers = get_auth_header("sai", "sai@123")
+    version = requests.get(f"{BASE_URL}/api/books/6", headers=headers).json()['version']
+    response = requests.post(f"{BASE_URL}/api/books/6/checkout", headers=headers,
+                             json={"version": version - 1})
+    check("checkout with a stale version", response.status_code, 409)
+    response = requests.post(f"{BASE_URL}/api/books/6/checkout", headers=headers,
+                             json={"version": version})
+    check("checkout with the current version", response.status_code, 200)
+    if response.status_code == 200:
+        check("version after checkout", response.json()['book']['version'], version + 1)
+    requests.post(f"{BASE_URL}/api/books/6/return", headers=headers)
+except Exception as e:
+    check("optimistic versioning", f"error {e}", "no error")
+
 print("\n" + "="*50)
 print("🎉 Test completed!")
 print("\n📌 Credentials to use:")
 print("   Username: sai, Password: sai@123")
-print("   Username: teja, Password: teja@123")
\ No newline at end of file
+print("   Username: teja, Password: teja@123")
+
+if failures:
+    print(f"\n❌ {len(failures)} lending check(s) failed: {', '.join(failures)}")
+    sys.exit(1)
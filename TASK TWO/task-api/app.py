@@ -7,7 +7,7 @@ import os
 
 app = Flask(__name__)
 
-TASKS_FILE = "tasks.json"
+TASKS_FILE = os.environ.get("TASKS_FILE", "tasks.json")
 
 
 def load_tasks():
@@ -0,0 +1,237 @@
+from quart import Quart, jsonify, request
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import os
+
+
+# ASGI version of app.py - same endpoints, same JSON responses.
+# Run with:  uvicorn app_async:app --port 5002
+app = Quart(__name__)
+
+TASKS_FILE = os.environ.get("TASKS_FILE", "tasks.json")
+
+# Tasks are loaded once at startup and served from memory.
+# Handlers change this list without awaiting in between, so no lock is needed.
+tasks = []
+
+# One thread writes tasks.json, so saves never block the event loop or overlap
+io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tasks-io")
+
+# Requests waiting for their change to reach the file
+save_waiters = []
+saver = None
+
+
+def load_tasks():
+    """Load tasks from JSON file"""
+    if os.path.exists(TASKS_FILE):
+        try:
+            with open(TASKS_FILE, 'r') as file:
+                return json.load(file)
+        except:
+            return []
+    return []
+
+def save_tasks(tasks):
+    """Save tasks to JSON file (write to temp file, then swap it in)"""
+    tmp_file = TASKS_FILE + ".tmp"
+    with open(tmp_file, 'w') as file:
+        json.dump(tasks, file, indent=2)
+    os.replace(tmp_file, TASKS_FILE)
+
+def get_next_id(tasks):
+    """Get next available ID"""
+    if not tasks:
+        return 1
+    return max(task['id'] for task in tasks) + 1
+
+@app.before_serving
+async def load_tasks_on_startup():
+    """Read tasks.json into memory once"""
+    loop = asyncio.get_running_loop()
+    tasks[:] = await loop.run_in_executor(io_executor, load_tasks)
+
+async def flush_saves():
+    """Write the current list until nobody is waiting; one write covers every change made before it"""
+    loop = asyncio.get_running_loop()
+    while save_waiters:
+        waiters = save_waiters[:]
+        save_waiters.clear()
+        snapshot = [dict(task) for task in tasks]
+        try:
+            await loop.run_in_executor(io_executor, save_tasks, snapshot)
+        except Exception as e:
+            for waiter in waiters:
+                waiter.set_exception(e)
+            continue
+        for waiter in waiters:
+            waiter.set_result(None)
+
+async def save_tasks_async():
+    """Wait until the in-memory tasks (including this request's change) are on disk"""
+    global saver
+    waiter = asyncio.get_running_loop().create_future()
+    save_waiters.append(waiter)
+    if saver is None or saver.done():
+        saver = asyncio.create_task(flush_saves())
+    await waiter
+
+@app.route('/')
+async def home():
+    """API documentation"""
+    return jsonify({
+        'api': 'Task Management System',
+        'version': '1.0.0',
+        'description': 'A simple REST API for managing tasks',
+        'endpoints': {
+            'GET /tasks': 'Get all tasks',
+            'POST /tasks': 'Create a new task',
+            'GET /tasks/<id>': 'Get a single task',
+            'PUT /tasks/<id>': 'Update a task',
+            'DELETE /tasks/<id>': 'Delete a task',
+            'GET /health': 'Check API health'
+        }
+    })
+
+@app.route('/tasks', methods=['GET'])
+async def get_all_tasks():
+    """Retrieve all tasks"""
+    return jsonify({
+        'success': True,
+        'count': len(tasks),
+        'tasks': tasks
+    })
+
+@app.route('/tasks', methods=['POST'])
+async def create_task():
+    """Create a new task"""
+    try:
+        data = await request.get_json()
+
+        if not data or 'title' not in data:
+            return jsonify({
+                'success': False,
+                'error': 'Title is required'
+            }), 400
+
+        new_task = {
+            'id': get_next_id(tasks),
+            'title': data['title'],
+            'description': data.get('description', ''),
+            'completed': False,
+            'created_at': '2024-01-15'
+        }
+
+        tasks.append(new_task)
+        response_task = dict(new_task)
+        await save_tasks_async()
+
+        return jsonify({
+            'success': True,
+            'message': 'Task created successfully',
+            'task': response_task
+        }), 201
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/tasks/<int:task_id>', methods=['GET'])
+async def get_task(task_id):
+    """Get a specific task by ID"""
+    for task in tasks:
+        if task['id'] == task_id:
+            return jsonify({
+                'success': True,
+                'task': task
+            })
+
+    return jsonify({
+        'success': False,
+        'error': f'Task with ID {task_id} not found'
+    }), 404
+
+
+@app.route('/tasks/<int:task_id>', methods=['PUT'])
+async def update_task(task_id):
+
+    try:
+        data = await request.get_json()
+
+        for task in tasks:
+            if task['id'] == task_id:
+
+                if 'title' in data:
+                    task['title'] = data['title']
+                if 'description' in data:
+                    task['description'] = data.get('description', task['description'])
+                if 'completed' in data:
+                    task['completed'] = data['completed']
+
+                # Copy before awaiting - another request may change it meanwhile
+                response_task = dict(task)
+                await save_tasks_async()
+
+                return jsonify({
+                    'success': True,
+                    'message': 'Task updated successfully',
+                    'task': response_task
+                })
+
+        return jsonify({
+            'success': False,
+            'error': f'Task with ID {task_id} not found'
+        }), 404
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/tasks/<int:task_id>', methods=['DELETE'])
+async def delete_task(task_id):
+
+    original_count = len(tasks)
+
+    tasks[:] = [task for task in tasks if task['id'] != task_id]
+
+    if len(tasks) < original_count:
+        await save_tasks_async()
+        return jsonify({
+            'success': True,
+            'message': f'Task with ID {task_id} deleted successfully'
+        })
+
+    return jsonify({
+        'success': False,
+        'error': f'Task with ID {task_id} not found'
+    }), 404
+
+@app.route('/health', methods=['GET'])
+async def health_check():
+    return jsonify({
+        'status': 'healthy',
+        'service': 'task-management-api',
+        'timestamp': '2024-01-15'
+    })
+
+if __name__ == '__main__':
+
+    if not os.path.exists(TASKS_FILE):
+        save_tasks([])
+        print(f" Created {TASKS_FILE}")
+
+    print("=" * 60)
+    print(" TASK MANAGEMENT API (ASYNC)")
+    print("=" * 60)
+    print(" URL: http://localhost:5002")
+    print(" Same endpoints as app.py, served on an asyncio event loop")
+    print(" For many connections run: uvicorn app_async:app --port 5002")
+    print("=" * 60)
+
+    app.run(port=5002, use_reloader=False)
@@ -0,0 +1,185 @@
+# SIDE-BY-SIDE BENCHMARK: app.py (WSGI, port 5001) vs app_async.py (ASGI, port 5002)
+#
+# Starts each server itself against its own temporary copy of tasks.json,
+# so both begin from identical data and the real tasks.json is never touched.
+# After each run it checks the file for tasks that were acknowledged but lost.
+#
+# Run:  python benchmark.py [concurrent_clients] [requests_per_client]
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SEED_FILE = os.path.join(HERE, 'tasks.json')
+HOST = '127.0.0.1'
+
+SERVERS = {
+    'WSGI (app.py)': (
+        5001,
+        [sys.executable, 'app.py'],
+    ),
+    'ASGI (app_async.py)': (
+        5002,
+        [sys.executable, '-m', 'uvicorn', 'app_async:app', '--port', '5002', '--log-level', 'warning'],
+    ),
+}
+
+CLIENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+REQUESTS_PER_CLIENT = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+
+# A bare HTTP/1.1 client on asyncio streams. Full HTTP client libraries cost
+# more CPU per request than the servers being measured, which skews results.
+async def send_request(conn, method, path, body=None):
+    """Send one request on conn and return the status code; reconnects if the server closed it"""
+    if conn.get('writer') is None:
+        conn['reader'], conn['writer'] = await asyncio.open_connection(HOST, conn['port'])
+
+    payload = json.dumps(body).encode() if body is not None else b''
+    head = f"{method} {path} HTTP/1.1\r\nHost: {HOST}\r\nContent-Length: {len(payload)}\r\n"
+    if body is not None:
+        head += "Content-Type: application/json\r\n"
+    conn['writer'].write(head.encode() + b"\r\n" + payload)
+    await conn['writer'].drain()
+
+    reader = conn['reader']
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('server closed the connection')
+    status = int(status_line.split()[1])
+
+    length = 0
+    keep_alive = status_line.startswith(b'HTTP/1.1')
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode().partition(':')
+        name = name.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'connection':
+            keep_alive = value.strip().lower() == 'keep-alive'
+    await reader.readexactly(length)
+
+    if not keep_alive:
+        close_connection(conn)
+    return status
+
+
+def close_connection(conn):
+    if conn.get('writer') is not None:
+        conn['writer'].close()
+    conn['reader'] = conn['writer'] = None
+
+
+async def client(port, latencies, errors, created):
+    """One client: mostly reads, one write at the end"""
+    conn = {'port': port}
+    for i in range(REQUESTS_PER_CLIENT):
+        start = time.perf_counter()
+        try:
+            if i == REQUESTS_PER_CLIENT - 1:
+                status = await send_request(conn, 'POST', '/tasks', {'title': 'Benchmark task'})
+            else:
+                status = await send_request(conn, 'GET', '/tasks')
+            if status >= 400:
+                errors.append(status)
+                continue
+            if status == 201:
+                created.append(1)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError) as e:
+            close_connection(conn)
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - start)
+    close_connection(conn)
+
+
+def count_saved_tasks(tasks_file):
+    """Number of tasks actually in the file, or None if it is not valid JSON"""
+    try:
+        with open(tasks_file) as file:
+            return len(json.load(file))
+    except (OSError, ValueError):
+        return None
+
+
+async def wait_until_up(port):
+    """Poll /health until the server answers (max ~15s)"""
+    for _ in range(150):
+        conn = {'port': port}
+        try:
+            await send_request(conn, 'GET', '/health')
+            return True
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+            await asyncio.sleep(0.1)
+        finally:
+            close_connection(conn)
+    return False
+
+
+async def run(name, port, command, data_dir):
+    # Fresh copy of the seed data for every run
+    tasks_file = os.path.join(data_dir, 'bench_tasks.json')
+    shutil.copyfile(SEED_FILE, tasks_file)
+    seed_count = count_saved_tasks(tasks_file)
+
+    env = dict(os.environ, TASKS_FILE=tasks_file)
+    server = subprocess.Popen(command, cwd=HERE, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    latencies = []
+    errors = []
+    created = []
+
+    try:
+        if not await wait_until_up(port):
+            print(f"   ❌ {name}: did not start on port {port}")
+            return
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port, latencies, errors, created) for _ in range(CLIENTS)))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+        saved_count = count_saved_tasks(tasks_file)
+        os.remove(tasks_file)
+
+    # Every 201 should have left a task behind in the file
+    expected_count = seed_count + len(created)
+
+    latencies.sort()
+    done = len(latencies)
+    print(f"   {name}")
+    print(f"     Requests OK:  {done}   Errors: {len(errors)}")
+    print(f"     Total time:   {elapsed:.2f}s")
+    print(f"     Throughput:   {done / elapsed:.0f} req/s")
+    if done:
+        print(f"     Latency p50:  {latencies[done // 2] * 1000:.1f} ms")
+        print(f"     Latency p99:  {latencies[int(done * 0.99) - 1] * 1000:.1f} ms")
+    if saved_count is None:
+        print(f"     Tasks saved:  file corrupted (expected {expected_count})")
+    else:
+        print(f"     Tasks saved:  {saved_count} of {expected_count} expected"
+              f"   Lost writes: {max(expected_count - saved_count, 0)}")
+
+
+async def main():
+    print("=" * 60)
+    print(f" BENCHMARK: {CLIENTS} concurrent clients x {REQUESTS_PER_CLIENT} requests")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as data_dir:
+        for name, (port, command) in SERVERS.items():
+            await run(name, port, command, data_dir)
+            print()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+# Checks app_async.py answers exactly like app.py
+# Run:  pip install pytest flask quart && python -m pytest test_parity.py
+import asyncio
+
+import app as wsgi
+import app_async
+
+
+# (method, path, json body) - covers success, 400 and 404 paths
+REQUESTS = [
+    ('GET', '/tasks', None),
+    ('POST', '/tasks', {}),
+    ('POST', '/tasks', {'title': 'First Task'}),
+    ('POST', '/tasks', {'title': 'Second Task', 'description': 'Details'}),
+    ('GET', '/tasks/1', None),
+    ('GET', '/tasks/99', None),
+    ('PUT', '/tasks/1', {'title': 'Renamed', 'completed': True}),
+    ('PUT', '/tasks/99', {'title': 'Missing'}),
+    ('DELETE', '/tasks/2', None),
+    ('DELETE', '/tasks/2', None),
+    ('GET', '/tasks', None),
+    ('GET', '/health', None),
+    ('GET', '/', None),
+]
+
+
+def run_wsgi():
+    client = wsgi.app.test_client()
+    results = []
+    for method, path, body in REQUESTS:
+        kwargs = {} if body is None else {'json': body}
+        response = client.open(path, method=method, **kwargs)
+        results.append((response.status_code, response.get_json()))
+    return results
+
+
+async def run_asgi():
+    results = []
+    # test_app() runs the startup hook that loads tasks into memory
+    async with app_async.app.test_app() as test_app:
+        client = test_app.test_client()
+        for method, path, body in REQUESTS:
+            kwargs = {} if body is None else {'json': body}
+            response = await client.open(path, method=method, **kwargs)
+            results.append((response.status_code, await response.get_json()))
+    return results
+
+
+def test_same_responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(wsgi, 'TASKS_FILE', str(tmp_path / 'wsgi.json'))
+    wsgi_results = run_wsgi()
+
+    monkeypatch.setattr(app_async, 'TASKS_FILE', str(tmp_path / 'asgi.json'))
+    asgi_results = asyncio.run(run_asgi())
+
+    for request, wsgi_result, asgi_result in zip(REQUESTS, wsgi_results, asgi_results):
+        assert wsgi_result == asgi_result, request
+
+
+def test_saved_file_matches_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_async, 'TASKS_FILE', str(tmp_path / 'asgi.json'))
+
+    async def create_many():
+        async with app_async.app.test_app() as test_app:
+            client = test_app.test_client()
+            await asyncio.gather(*(client.post('/tasks', json={'title': f'Task {i}'}) for i in range(50)))
+
+    asyncio.run(create_many())
+    saved = app_async.load_tasks()
+    assert [task['id'] for task in saved] == list(range(1, 51))